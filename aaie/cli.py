@@ -10,11 +10,12 @@ app = typer.Typer(help="Auto Architecture Intelligence Engine (AAIE)")
 def scan(
     repo_path: Path = typer.Argument(..., exists=True, file_okay=False, dir_okay=True, help="Path to the repository to scan"),
     output: Optional[Path] = typer.Option(None, "-o", "--output", help="Output path for the report"),
-    config: Optional[Path] = typer.Option(None, "-c", "--config", help="Path to config file")
+    config: Optional[Path] = typer.Option(None, "-c", "--config", help="Path to config file"),
+    jobs: int = typer.Option(1, "-j", "--jobs", help="Number of parser processes (1 = serial)")
 ) -> None:
     """Scan a repository and generate an architecture analysis."""
-    orchestrator = Orchestrator()
-    
+    orchestrator = Orchestrator(Config(jobs=jobs))
+
     typer.echo(f"Scanning repository: {repo_path}")
     result = orchestrator.scan(repo_path)
     
@@ -92,16 +93,18 @@ def diff(
     
     from aaie.reports import MarkdownGenerator
     md_gen = MarkdownGenerator()
-    
+
+    # Both scans were just loaded by id, so they are stored; let SQLite
+    # compute the delta instead of re-diffing the full results in Python.
+    scan_diff = orchestrator.store.db.get_diff(run1, run2)
+
     if output:
-        md_gen.generate_diff_report(result1, result2, output)
+        md_gen.generate_diff_report(result1, result2, output, diff=scan_diff)
         typer.echo(f"Diff report saved to: {output}")
     else:
         typer.echo("Diff Report:")
-        old_nodes = {n.id for n in result1.nodes}
-        new_nodes = {n.id for n in result2.nodes}
-        typer.echo(f"  Added nodes: {len(new_nodes - old_nodes)}")
-        typer.echo(f"  Removed nodes: {len(old_nodes - new_nodes)}")
+        typer.echo(f"  Added nodes: {len(scan_diff['added_nodes'])}")
+        typer.echo(f"  Removed nodes: {len(scan_diff['removed_nodes'])}")
 
 
 if __name__ == "__main__":
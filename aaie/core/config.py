@@ -13,6 +13,7 @@ class Config(BaseModel):
     max_file_size: int = 1024 * 1024
     enable_rules: list[str] = ["circular_dependency", "single_point_failure", "secret_detector"]
     spf_threshold: int = 3
+    jobs: int = 1
     
     class Config:
         arbitrary_types_allowed = True
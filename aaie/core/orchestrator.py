@@ -1,5 +1,10 @@
+import fnmatch
 import os
+import re
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from pathlib import Path
+from threading import Lock
 from typing import Any
 from aaie.core.config import Config, DEFAULT_CONFIG
 from aaie.graph.models import ScanResult, Node, Edge, Finding
@@ -22,11 +27,45 @@ from aaie.storage import RepositoryStore
 from aaie.reports import MarkdownGenerator, DiagramGenerator
 
 
+WALK_WORKERS = 8
+
+RESULT_CACHE_SIZE = 128
+
+RESULT_NODE_TYPES = (
+    "service",
+    "database",
+    "queue",
+    "external_api",
+    "container",
+    "infra_resource",
+    "library"
+)
+
+_PARSER_CLASSES: dict[str, type[BaseParser]] = {
+    cls.__name__: cls
+    for cls in (PythonParser, TerraformParser, DockerParser, K8sParser, PackageParser)
+}
+
+
+def _parse_one(parser_cls_name: str, file_path: Path) -> tuple[list[Node], list[Edge]]:
+    """Parse a single file in a worker process.
+
+    Top-level so it can be pickled by ProcessPoolExecutor; parsers are cheap
+    to instantiate and carry no shared state across processes.
+    """
+    parser = _PARSER_CLASSES[parser_cls_name]()
+    return parser.parse(file_path)
+
+
 class Orchestrator:
     """Main orchestrator for the AAIE engine."""
 
     def __init__(self, config: Config | None = None) -> None:
         self.config = config or DEFAULT_CONFIG
+        self._include_re = re.compile(
+            "(?:" + "|".join(fnmatch.translate(p) for p in self.config.include_patterns) + ")"
+        )
+        self._exclude_dirs = frozenset(self.config.exclude_patterns)
         self.parsers: list[BaseParser] = [
             PythonParser(),
             TerraformParser(),
@@ -40,6 +79,16 @@ class Orchestrator:
             SecretDetectorRule()
         ]
         self.store = RepositoryStore()
+        self._result_cache: OrderedDict[int, ScanResult] = OrderedDict()
+        self._result_cache_lock = Lock()
+
+        self._parser_by_suffix: dict[str, BaseParser] = {}
+        self._parser_by_name: dict[str, BaseParser] = {}
+        for parser in self.parsers:
+            for ext in parser.supported_extensions:
+                self._parser_by_suffix.setdefault(ext, parser)
+            for name in parser.supported_filenames:
+                self._parser_by_name.setdefault(name, parser)
 
     def scan(self, repo_path: Path) -> ScanResult:
         repo_path = repo_path.resolve()
@@ -48,27 +97,38 @@ class Orchestrator:
         
         graph = GraphBuilder()
         graph.add_nodes_from(nodes)
-        
+
+        node_ids = {node.id for node in nodes}
         seen_edges: set[tuple[str, str]] = set()
+        unique_edges = []
         for edge in edges:
-            if (edge.source, edge.target) not in seen_edges:
-                try:
-                    graph.add_edge(edge)
-                    seen_edges.add((edge.source, edge.target))
-                except ValueError:
-                    pass
-        
+            key = (edge.source, edge.target)
+            if key in seen_edges or edge.source not in node_ids or edge.target not in node_ids:
+                continue
+            seen_edges.add(key)
+            unique_edges.append(edge)
+        graph.add_edges_from(unique_edges)
+
+
         findings = self._evaluate_rules(graph.graph)
-        
-        result = ScanResult(
+
+        by_type: dict[str, list[Node]] = {}
+        for node_id, data in graph.node_items():
+            node_type = data.get("type", "service")
+            by_type.setdefault(node_type, []).append(Node(
+                id=node_id,
+                name=data.get("name", node_id),
+                type=node_type,
+                metadata=data.get("metadata", {})
+            ))
+
+        result_nodes: list[Node] = []
+        for node_type in RESULT_NODE_TYPES:
+            result_nodes.extend(by_type.get(node_type, []))
+
+        result = ScanResult.model_construct(
             repo_id=self.store._generate_repo_id(repo_path),
-            nodes=graph.get_nodes_by_type("service") + 
-                  graph.get_nodes_by_type("database") + 
-                  graph.get_nodes_by_type("queue") +
-                  graph.get_nodes_by_type("external_api") +
-                  graph.get_nodes_by_type("container") +
-                  graph.get_nodes_by_type("infra_resource") +
-                  graph.get_nodes_by_type("library"),
+            nodes=result_nodes,
             edges=graph.get_edges(),
             findings=findings,
             metadata={"repo_path": str(repo_path)}
@@ -79,62 +139,102 @@ class Orchestrator:
     def _collect_entities(self, repo_path: Path) -> tuple[list[Node], list[Edge]]:
         all_nodes: list[Node] = []
         all_edges: list[Edge] = []
-        
+
         seen_node_ids: set[str] = set()
-        
-        for file_path in self._walk_repository(repo_path):
+
+        tasks: list[tuple[BaseParser, Path]] = []
+        for file_path, file_size in self._walk_repository(repo_path):
             parser = self._select_parser(file_path)
             if parser is None:
                 continue
-            
-            try:
-                if file_path.stat().st_size > self.config.max_file_size:
-                    continue
-            except OSError:
+
+            if file_size > self.config.max_file_size:
                 continue
-            
-            nodes, edges = parser.parse(file_path)
-            
+
+            tasks.append((parser, file_path))
+
+        if self.config.jobs > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=self.config.jobs) as executor:
+                results = list(executor.map(
+                    _parse_one,
+                    [type(parser).__name__ for parser, _ in tasks],
+                    [file_path for _, file_path in tasks],
+                    chunksize=16
+                ))
+        else:
+            results = [parser.parse(file_path) for parser, file_path in tasks]
+
+        for nodes, edges in results:
             for node in nodes:
                 if node.id not in seen_node_ids:
                     all_nodes.append(node)
                     seen_node_ids.add(node.id)
-            
+
             all_edges.extend(edges)
-        
+
         return all_nodes, all_edges
 
-    def _walk_repository(self, repo_path: Path) -> list[Path]:
-        files = []
-        
-        for root, dirs, filenames in os.walk(repo_path):
-            dirs[:] = [d for d in dirs if d not in self.config.exclude_patterns]
-            
-            root_path = Path(root)
-            
-            for filename in filenames:
-                file_path = root_path / filename
-                
-                if any(file_path.match(pattern) for pattern in self.config.include_patterns):
-                    files.append(file_path)
-        
+    def _walk_repository(self, repo_path: Path) -> list[tuple[Path, int]]:
+        """Enumerate matching files with their sizes, scanning directories concurrently."""
+        include_match = self._include_re.match
+        exclude_dirs = self._exclude_dirs
+
+        def scan_dir(dir_path: str) -> tuple[list[tuple[Path, int]], list[str]]:
+            found: list[tuple[Path, int]] = []
+            subdirs: list[str] = []
+            try:
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if entry.name not in exclude_dirs:
+                                    subdirs.append(entry.path)
+                            elif include_match(entry.name):
+                                size = entry.stat(follow_symlinks=False).st_size
+                                found.append((Path(entry.path), size))
+                        except OSError:
+                            continue
+            except OSError:
+                pass
+            return found, subdirs
+
+        files: list[tuple[Path, int]] = []
+        with ThreadPoolExecutor(max_workers=WALK_WORKERS) as executor:
+            pending = {executor.submit(scan_dir, str(repo_path))}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    found, subdirs = future.result()
+                    files.extend(found)
+                    pending.update(executor.submit(scan_dir, d) for d in subdirs)
         return files
 
     def _select_parser(self, file_path: Path) -> BaseParser | None:
+        candidate = (
+            self._parser_by_name.get(file_path.name)
+            or self._parser_by_suffix.get(file_path.suffix)
+        )
+        if candidate is not None:
+            return candidate if candidate.can_parse(file_path) else None
+
         for parser in self.parsers:
             if parser.can_parse(file_path):
                 return parser
         return None
 
     def _evaluate_rules(self, graph) -> list[Finding]:
-        from aaie.graph.models import Finding
-        
-        findings = []
-        
-        for rule in self.rules:
-            if rule.rule_id in self.config.enable_rules:
-                findings.extend(rule.evaluate(graph))
-        
+        enabled = [rule for rule in self.rules if rule.rule_id in self.config.enable_rules]
+        if not enabled:
+            return []
+
+        if len(enabled) == 1:
+            return list(enabled[0].evaluate(graph))
+
+        findings: list[Finding] = []
+        with ThreadPoolExecutor(max_workers=len(enabled)) as executor:
+            futures = [executor.submit(rule.evaluate, graph) for rule in enabled]
+            for future in futures:
+                findings.extend(future.result())
         return findings
 
     def generate_report(self, result: ScanResult, output_path: Path) -> None:
@@ -145,10 +245,28 @@ class Orchestrator:
         diag_gen.generate_dot(result, output_path.with_suffix(".dot"))
 
     def save_result(self, repo_path: Path, result: ScanResult) -> int:
-        return self.store.save_scan_result(repo_path, result)
+        scan_id = self.store.save_scan_result(repo_path, result)
+        self._cache_result(scan_id, result)
+        return scan_id
 
     def get_result(self, scan_id: int) -> ScanResult | None:
-        return self.store.get_scan_result(scan_id)
+        with self._result_cache_lock:
+            cached = self._result_cache.get(scan_id)
+            if cached is not None:
+                self._result_cache.move_to_end(scan_id)
+                return cached
+
+        result = self.store.get_scan_result(scan_id)
+        if result is not None:
+            self._cache_result(scan_id, result)
+        return result
+
+    def _cache_result(self, scan_id: int, result: ScanResult) -> None:
+        with self._result_cache_lock:
+            self._result_cache[scan_id] = result
+            self._result_cache.move_to_end(scan_id)
+            while len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
 
     def list_repositories(self) -> list[dict[str, Any]]:
         return self.store.list_repositories()
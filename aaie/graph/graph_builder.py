@@ -1,55 +1,102 @@
 import networkx as nx
-from typing import Any
+from typing import Any, Iterable
 from aaie.graph.models import Node, Edge, Finding
 
 
 class GraphBuilder:
-    """Builds and manages the architecture dependency graph using NetworkX DiGraph."""
+    """Builds and manages the architecture dependency graph.
+
+    Nodes and edges are stored in plain adjacency dicts, which keeps
+    construction and traversal free of NetworkX per-call overhead. A
+    NetworkX DiGraph is materialized lazily through the `graph` property
+    for rules and reports that need graph algorithms.
+    """
 
     def __init__(self) -> None:
-        self._graph: nx.DiGraph = nx.DiGraph()
+        self._nodes: dict[str, dict[str, Any]] = {}
+        self._succ: dict[str, dict[str, dict[str, Any]]] = {}
+        self._pred: dict[str, dict[str, dict[str, Any]]] = {}
+        self._nx: nx.DiGraph | None = None
 
     @property
     def graph(self) -> nx.DiGraph:
-        return self._graph
+        """NetworkX view of the graph, built on first use and cached until mutation."""
+        if self._nx is None:
+            graph = nx.DiGraph()
+            graph.add_nodes_from(self._nodes.items())
+            graph.add_edges_from(
+                (source, target, data)
+                for source, targets in self._succ.items()
+                for target, data in targets.items()
+            )
+            self._nx = graph
+        return self._nx
 
     def add_node(self, node: Node) -> None:
         """Add a node to the graph, updating if it already exists."""
-        self._graph.add_node(
-            node.id,
-            name=node.name,
-            type=node.type,
-            metadata=node.metadata
-        )
+        self._nodes[node.id] = {
+            "name": node.name,
+            "type": node.type,
+            "metadata": node.metadata
+        }
+        self._succ.setdefault(node.id, {})
+        self._pred.setdefault(node.id, {})
+        self._nx = None
 
     def add_edge(self, edge: Edge) -> None:
         """Add an edge to the graph."""
-        if edge.source not in self._graph:
+        if edge.source not in self._nodes:
             raise ValueError(f"Source node {edge.source} not in graph")
-        if edge.target not in self._graph:
+        if edge.target not in self._nodes:
             raise ValueError(f"Target node {edge.target} not in graph")
-        self._graph.add_edge(
-            edge.source,
-            edge.target,
-            type=edge.type,
-            metadata=edge.metadata
-        )
+        data = {"type": edge.type, "metadata": edge.metadata}
+        self._succ[edge.source][edge.target] = data
+        self._pred[edge.target][edge.source] = data
+        self._nx = None
 
     def add_nodes_from(self, nodes: list[Node]) -> None:
-        """Add multiple nodes to the graph."""
+        """Add multiple nodes to the graph in one batch."""
+        self._nodes.update(
+            (node.id, {"name": node.name, "type": node.type, "metadata": node.metadata})
+            for node in nodes
+        )
+        succ = self._succ
+        pred = self._pred
         for node in nodes:
-            self.add_node(node)
+            succ.setdefault(node.id, {})
+            pred.setdefault(node.id, {})
+        self._nx = None
 
     def add_edges_from(self, edges: list[Edge]) -> None:
-        """Add multiple edges to the graph."""
+        """Add multiple edges to the graph in one batch."""
+        nodes = self._nodes
+        succ = self._succ
+        pred = self._pred
         for edge in edges:
-            self.add_edge(edge)
+            if edge.source not in nodes:
+                raise ValueError(f"Source node {edge.source} not in graph")
+            if edge.target not in nodes:
+                raise ValueError(f"Target node {edge.target} not in graph")
+            data = {"type": edge.type, "metadata": edge.metadata}
+            succ[edge.source][edge.target] = data
+            pred[edge.target][edge.source] = data
+        self._nx = None
+
+    def node_items(self) -> Iterable[tuple[str, dict[str, Any]]]:
+        """Iterate over (node_id, attributes) pairs."""
+        return self._nodes.items()
+
+    def edge_items(self) -> Iterable[tuple[str, str, dict[str, Any]]]:
+        """Iterate over (source, target, attributes) triples."""
+        for source, targets in self._succ.items():
+            for target, data in targets.items():
+                yield source, target, data
 
     def get_node(self, node_id: str) -> Node | None:
         """Retrieve a node by ID."""
-        if node_id not in self._graph:
+        data = self._nodes.get(node_id)
+        if data is None:
             return None
-        data = self._graph.nodes[node_id]
         return Node(
             id=node_id,
             name=data.get("name", node_id),
@@ -60,7 +107,7 @@ class GraphBuilder:
     def get_nodes_by_type(self, node_type: str) -> list[Node]:
         """Get all nodes of a specific type."""
         nodes = []
-        for node_id, data in self._graph.nodes(data=True):
+        for node_id, data in self._nodes.items():
             if data.get("type") == node_type:
                 nodes.append(Node(
                     id=node_id,
@@ -73,7 +120,7 @@ class GraphBuilder:
     def get_edges(self) -> list[Edge]:
         """Get all edges in the graph."""
         edges = []
-        for source, target, data in self._graph.edges(data=True):
+        for source, target, data in self.edge_items():
             edges.append(Edge(
                 source=source,
                 target=target,
@@ -84,48 +131,58 @@ class GraphBuilder:
 
     def get_in_degree(self, node_id: str) -> int:
         """Get the in-degree of a node."""
-        return self._graph.in_degree(node_id)
+        return len(self._pred.get(node_id, ()))
 
     def get_out_degree(self, node_id: str) -> int:
         """Get the out-degree of a node."""
-        return self._graph.out_degree(node_id)
+        return len(self._succ.get(node_id, ()))
 
     def get_predecessors(self, node_id: str) -> list[str]:
         """Get all predecessors of a node."""
-        return list(self._graph.predecessors(node_id))
+        return list(self._pred.get(node_id, ()))
 
     def get_successors(self, node_id: str) -> list[str]:
         """Get all successors of a node."""
-        return list(self._graph.successors(node_id))
+        return list(self._succ.get(node_id, ()))
 
     def nodes(self) -> list[str]:
         """Get all node IDs."""
-        return list(self._graph.nodes())
+        return list(self._nodes)
 
     def edges(self) -> list[tuple[str, str]]:
         """Get all edges as tuples."""
-        return list(self._graph.edges())
+        return [(source, target) for source, target, _ in self.edge_items()]
 
     def number_of_nodes(self) -> int:
         """Get the number of nodes."""
-        return self._graph.number_of_nodes()
+        return len(self._nodes)
 
     def number_of_edges(self) -> int:
         """Get the number of edges."""
-        return self._graph.number_of_edges()
+        return sum(len(targets) for targets in self._succ.values())
 
     def to_dict(self) -> dict[str, Any]:
         """Export graph to dictionary format."""
-        return nx.node_link_data(self._graph)
+        return nx.node_link_data(self.graph)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "GraphBuilder":
         """Import graph from dictionary format."""
         builder = cls()
         graph = nx.node_link_graph(data)
-        builder._graph = graph
+        for node_id, attrs in graph.nodes(data=True):
+            builder._nodes[node_id] = dict(attrs)
+            builder._succ.setdefault(node_id, {})
+            builder._pred.setdefault(node_id, {})
+        for source, target, attrs in graph.edges(data=True):
+            edge_data = dict(attrs)
+            builder._succ[source][target] = edge_data
+            builder._pred[target][source] = edge_data
         return builder
 
     def clear(self) -> None:
         """Clear all nodes and edges from the graph."""
-        self._graph.clear()
+        self._nodes.clear()
+        self._succ.clear()
+        self._pred.clear()
+        self._nx = None
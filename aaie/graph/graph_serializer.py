@@ -1,4 +1,6 @@
-import json
+import orjson
+import pickle
+import zlib
 from pathlib import Path
 from typing import Any
 import networkx as nx
@@ -12,32 +14,33 @@ class GraphSerializer:
     @staticmethod
     def to_json(builder: GraphBuilder, path: Path) -> None:
         """Export graph to JSON file."""
-        data = {
-            "nodes": [
-                {
-                    "id": node_id,
-                    "name": builder._graph.nodes[node_id].get("name", node_id),
-                    "type": builder._graph.nodes[node_id].get("type", "service"),
-                    "metadata": builder._graph.nodes[node_id].get("metadata", {})
-                }
-                for node_id in builder._graph.nodes()
-            ],
-            "edges": [
-                {
-                    "source": source,
-                    "target": target,
-                    "type": builder._graph.edges[source, target].get("type", "depends_on"),
-                    "metadata": builder._graph.edges[source, target].get("metadata", {})
-                }
-                for source, target in builder._graph.edges()
-            ]
-        }
-        path.write_text(json.dumps(data, indent=2))
+        data = GraphSerializer.to_dict(builder)
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
     @staticmethod
     def from_json(path: Path) -> GraphBuilder:
         """Import graph from JSON file."""
-        data = json.loads(path.read_text())
+        data = orjson.loads(path.read_bytes())
+        return GraphSerializer._from_payload(data)
+
+    @staticmethod
+    def to_pickle(builder: GraphBuilder, path: Path) -> None:
+        """Export graph to a compressed binary cache file.
+
+        Intended for machine-read caches; use to_json for user-facing export.
+        """
+        data = GraphSerializer.to_dict(builder)
+        path.write_bytes(zlib.compress(pickle.dumps(data, protocol=5)))
+
+    @staticmethod
+    def from_pickle(path: Path) -> GraphBuilder:
+        """Import graph from a compressed binary cache file."""
+        data = pickle.loads(zlib.decompress(path.read_bytes()))
+        return GraphSerializer._from_payload(data)
+
+    @staticmethod
+    def _from_payload(data: dict[str, Any]) -> GraphBuilder:
+        """Rebuild a GraphBuilder from a nodes/edges payload dict."""
         builder = GraphBuilder()
 
         for node_data in data.get("nodes", []):
@@ -72,21 +75,21 @@ class GraphSerializer:
     def to_dict(builder: GraphBuilder) -> dict[str, Any]:
         """Export graph to dictionary."""
         nodes = []
-        for node_id in builder._graph.nodes():
+        for node_id, data in builder.node_items():
             nodes.append({
                 "id": node_id,
-                "name": builder._graph.nodes[node_id].get("name", node_id),
-                "type": builder._graph.nodes[node_id].get("type", "service"),
-                "metadata": builder._graph.nodes[node_id].get("metadata", {})
+                "name": data.get("name", node_id),
+                "type": data.get("type", "service"),
+                "metadata": data.get("metadata", {})
             })
 
         edges = []
-        for source, target in builder._graph.edges():
+        for source, target, data in builder.edge_items():
             edges.append({
                 "source": source,
                 "target": target,
-                "type": builder._graph.edges[source, target].get("type", "depends_on"),
-                "metadata": builder._graph.edges[source, target].get("metadata", {})
+                "type": data.get("type", "depends_on"),
+                "metadata": data.get("metadata", {})
             })
 
         return {"nodes": nodes, "edges": edges}
@@ -1,3 +1,5 @@
+import sys
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 from pydantic import BaseModel, Field
@@ -21,32 +23,48 @@ class EdgeType(Enum):
     DEPLOYS = "deploys"
 
 
-class Node(BaseModel):
-    id: str = Field(description="Unique identifier for the node")
-    name: str = Field(description="Human-readable name")
-    type: NodeType = Field(description="Type of the node")
-    metadata: dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
+# Interned type values so hot comparisons against literals are pointer checks.
+_NODE_TYPE_CACHE = {t.value: sys.intern(t.value) for t in NodeType}
+_EDGE_TYPE_CACHE = {t.value: sys.intern(t.value) for t in EdgeType}
 
-    class Config:
-        use_enum_values = True
 
+@dataclass(slots=True, frozen=True)
+class Node:
+    """A node in the architecture graph. The type is stored as its string value."""
 
-class Edge(BaseModel):
-    source: str = Field(description="Source node ID")
-    target: str = Field(description="Target node ID")
-    type: EdgeType = Field(description="Type of relationship")
-    metadata: dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
+    id: str
+    name: str
+    type: NodeType | str
+    metadata: dict[str, Any] = field(default_factory=dict)
 
-    class Config:
-        use_enum_values = True
+    def __post_init__(self) -> None:
+        type_value = self.type.value if isinstance(self.type, NodeType) else self.type
+        object.__setattr__(self, "type", _NODE_TYPE_CACHE.get(type_value) or sys.intern(type_value))
 
 
-class Finding(BaseModel):
-    rule_id: str = Field(description="Identifier of the rule that generated this finding")
-    severity: str = Field(description="Severity level: info, warning, error")
-    message: str = Field(description="Human-readable description")
-    node_ids: list[str] = Field(default_factory=list, description="Related node IDs")
-    metadata: dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
+@dataclass(slots=True, frozen=True)
+class Edge:
+    """A directed edge between two nodes. The type is stored as its string value."""
+
+    source: str
+    target: str
+    type: EdgeType | str
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        type_value = self.type.value if isinstance(self.type, EdgeType) else self.type
+        object.__setattr__(self, "type", _EDGE_TYPE_CACHE.get(type_value) or sys.intern(type_value))
+
+
+@dataclass(slots=True, frozen=True)
+class Finding:
+    """A rule finding with severity info, warning or error."""
+
+    rule_id: str
+    severity: str
+    message: str
+    node_ids: list[str] = field(default_factory=list)
+    metadata: dict[str, Any] = field(default_factory=dict)
 
 
 class ScanResult(BaseModel):
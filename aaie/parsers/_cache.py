@@ -0,0 +1,38 @@
+"""Memoized file loading shared by parsers.
+
+Entries are keyed by (path, mtime_ns), so they self-invalidate whenever a
+file changes on disk; repeated scans in a long-lived process skip redundant
+reads and re-parses of unchanged files.
+"""
+import ast
+import functools
+import yaml
+from pathlib import Path
+from typing import Any
+
+# Use the libyaml C loader when available; it parses manifests roughly an
+# order of magnitude faster than the pure-Python SafeLoader.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=2048)
+def load_bytes(path_str: str, mtime_ns: int) -> bytes:
+    """Read a file as raw bytes, memoized on (path, mtime)."""
+    return Path(path_str).read_bytes()
+
+
+@functools.lru_cache(maxsize=512)
+def load_yaml_docs(path_str: str, mtime_ns: int) -> tuple[Any, ...]:
+    """Parse all YAML documents in a file, memoized on (path, mtime).
+
+    Bytes are handed to the loader as-is: libyaml decodes UTF-8 in C,
+    which beats a separate str.decode pass in Python.
+    """
+    content = load_bytes(path_str, mtime_ns)
+    return tuple(yaml.load_all(content, Loader=_YAML_LOADER))
+
+
+@functools.lru_cache(maxsize=1024)
+def load_python_ast(path_str: str, mtime_ns: int) -> ast.Module:
+    """Parse a Python source file to an AST, memoized on (path, mtime)."""
+    return ast.parse(load_bytes(path_str, mtime_ns), filename=path_str)
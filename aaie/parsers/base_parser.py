@@ -1,3 +1,4 @@
+import mmap
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any
@@ -35,6 +36,14 @@ class BaseParser(ABC):
         """
         pass
 
+    def _mmap(self, file_path: Path) -> mmap.mmap:
+        """Memory-map a file read-only so bytes regexes can scan it without a copy.
+
+        Raises ValueError for zero-length files, which cannot be mapped.
+        """
+        with open(file_path, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
     @property
     def supported_extensions(self) -> list[str]:
         """Return list of supported file extensions."""
@@ -1,9 +1,14 @@
+import mmap
 import re
 from pathlib import Path
 from typing import Any
 from aaie.graph.models import Node, Edge, NodeType, EdgeType
 from aaie.parsers.base_parser import BaseParser
 
+_FROM_RE = re.compile(rb'^FROM\s+(?:--platform=[^\s]+\s+)?([^\s]+)', re.MULTILINE)
+_EXPOSE_RE = re.compile(rb'^EXPOSE\s+(\d+)', re.MULTILINE)
+_ARG_RE = re.compile(rb'^ARG\s+([^\s=]+)', re.MULTILINE)
+
 
 class DockerParser(BaseParser):
     """Parser for Dockerfiles."""
@@ -25,14 +30,21 @@ class DockerParser(BaseParser):
         if file_path.name == ".dockerignore":
             return nodes, edges
 
+        content: mmap.mmap | bytes
         try:
-            content = file_path.read_text(encoding="utf-8")
+            content = self._mmap(file_path)
+        except ValueError:
+            content = b""
         except Exception:
             return nodes, edges
 
-        base_image = self._extract_base_image(content)
-        exposed_ports = self._extract_ports(content)
-        build_args = self._extract_build_args(content)
+        try:
+            base_image = self._extract_base_image(content)
+            exposed_ports = self._extract_ports(content)
+            build_args = self._extract_build_args(content)
+        finally:
+            if isinstance(content, mmap.mmap):
+                content.close()
 
         container_id = f"container:{file_path.parent.name}"
         container_node = Node(
@@ -66,22 +78,14 @@ class DockerParser(BaseParser):
 
         return nodes, edges
 
-    def _extract_base_image(self, content: str) -> str | None:
-        match = re.search(r'^FROM\s+(?:--platform=[^\s]+\s+)?([^\s]+)', content, re.MULTILINE)
+    def _extract_base_image(self, content: mmap.mmap | bytes) -> str | None:
+        match = _FROM_RE.search(content)
         if match:
-            return match.group(1)
+            return match.group(1).decode("utf-8", errors="replace")
         return None
 
-    def _extract_ports(self, content: str) -> list[str]:
-        ports = []
-        matches = re.findall(r'^EXPOSE\s+(\d+)', content, re.MULTILINE)
-        for match in matches:
-            ports.append(match)
-        return ports
-
-    def _extract_build_args(self, content: str) -> list[str]:
-        args = []
-        matches = re.findall(r'^ARG\s+([^\s=]+)', content, re.MULTILINE)
-        for match in matches:
-            args.append(match)
-        return args
+    def _extract_ports(self, content: mmap.mmap | bytes) -> list[str]:
+        return [port.decode("ascii") for port in _EXPOSE_RE.findall(content)]
+
+    def _extract_build_args(self, content: mmap.mmap | bytes) -> list[str]:
+        return [arg.decode("utf-8", errors="replace") for arg in _ARG_RE.findall(content)]
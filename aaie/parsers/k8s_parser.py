@@ -1,10 +1,46 @@
 import re
-import yaml
 from pathlib import Path
 from typing import Any
 from aaie.graph.models import Node, Edge, NodeType, EdgeType
+from aaie.parsers._cache import load_yaml_docs
 from aaie.parsers.base_parser import BaseParser
 
+_K8S_KINDS: frozenset[str] = frozenset({
+    "Deployment", "Service", "ConfigMap", "Secret", "Pod",
+    "StatefulSet", "DaemonSet", "Job", "CronJob", "Ingress",
+    "Namespace", "PersistentVolume", "PersistentVolumeClaim",
+    "ServiceAccount", "Role", "RoleBinding", "ClusterRole",
+    "ClusterRoleBinding", "NetworkPolicy"
+})
+
+_TYPE_MAPPING: dict[str, NodeType] = {
+    "Deployment": NodeType.SERVICE,
+    "Service": NodeType.SERVICE,
+    "Pod": NodeType.CONTAINER,
+    "StatefulSet": NodeType.SERVICE,
+    "DaemonSet": NodeType.SERVICE,
+    "Job": NodeType.SERVICE,
+    "CronJob": NodeType.SERVICE,
+    "ConfigMap": NodeType.INFRA_RESOURCE,
+    "Secret": NodeType.INFRA_RESOURCE,
+    "Ingress": NodeType.INFRA_RESOURCE,
+    "PersistentVolume": NodeType.INFRA_RESOURCE,
+    "PersistentVolumeClaim": NodeType.DATABASE,
+    "Namespace": NodeType.INFRA_RESOURCE,
+    "ServiceAccount": NodeType.INFRA_RESOURCE,
+    "Role": NodeType.INFRA_RESOURCE,
+    "ClusterRole": NodeType.INFRA_RESOURCE,
+}
+
+# Cheap probe for a top-level kind we care about, so can_parse never has to
+# run the YAML parser; parse still decides per document.
+_KIND_PROBE_RE = re.compile(
+    rb'^kind\s*:\s*["\']?(?:' +
+    b"|".join(kind.encode() for kind in sorted(_K8S_KINDS)) +
+    rb')["\']?\s*(?:#.*)?$',
+    re.MULTILINE
+)
+
 
 class K8sParser(BaseParser):
     """Parser for Kubernetes YAML manifests."""
@@ -20,28 +56,17 @@ class K8sParser(BaseParser):
         if file_path.suffix not in (".yaml", ".yml"):
             return False
         try:
-            content = file_path.read_text(encoding="utf-8")
-            docs = list(yaml.safe_load_all(content))
-            for doc in docs:
-                if doc and isinstance(doc, dict):
-                    kind = doc.get("kind", "")
-                    if kind in ("Deployment", "Service", "ConfigMap", "Secret", "Pod", 
-                               "StatefulSet", "DaemonSet", "Job", "CronJob", "Ingress",
-                               "Namespace", "PersistentVolume", "PersistentVolumeClaim",
-                               "ServiceAccount", "Role", "RoleBinding", "ClusterRole",
-                               "ClusterRoleBinding", "NetworkPolicy"):
-                        return True
+            content = file_path.read_bytes()
         except Exception:
-            pass
-        return False
+            return False
+        return _KIND_PROBE_RE.search(content) is not None
 
     def parse(self, file_path: Path) -> tuple[list[Node], list[Edge]]:
         nodes: list[Node] = []
         edges: list[Edge] = []
 
         try:
-            content = file_path.read_text(encoding="utf-8")
-            docs = list(yaml.safe_load_all(content))
+            docs = load_yaml_docs(str(file_path), file_path.stat().st_mtime_ns)
         except Exception:
             return nodes, edges
 
@@ -99,26 +124,7 @@ class K8sParser(BaseParser):
         return nodes, edges
 
     def _create_node(self, kind: str, name: str, namespace: str, doc: dict[str, Any]) -> Node | None:
-        type_mapping = {
-            "Deployment": NodeType.SERVICE,
-            "Service": NodeType.SERVICE,
-            "Pod": NodeType.CONTAINER,
-            "StatefulSet": NodeType.SERVICE,
-            "DaemonSet": NodeType.SERVICE,
-            "Job": NodeType.SERVICE,
-            "CronJob": NodeType.SERVICE,
-            "ConfigMap": NodeType.INFRA_RESOURCE,
-            "Secret": NodeType.INFRA_RESOURCE,
-            "Ingress": NodeType.INFRA_RESOURCE,
-            "PersistentVolume": NodeType.INFRA_RESOURCE,
-            "PersistentVolumeClaim": NodeType.DATABASE,
-            "Namespace": NodeType.INFRA_RESOURCE,
-            "ServiceAccount": NodeType.INFRA_RESOURCE,
-            "Role": NodeType.INFRA_RESOURCE,
-            "ClusterRole": NodeType.INFRA_RESOURCE,
-        }
-
-        node_type = type_mapping.get(kind, NodeType.INFRA_RESOURCE)
+        node_type = _TYPE_MAPPING.get(kind, NodeType.INFRA_RESOURCE)
 
         metadata: dict[str, Any] = {
             "namespace": namespace,
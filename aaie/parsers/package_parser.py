@@ -1,10 +1,15 @@
-import json
 import re
+
+import orjson
 from pathlib import Path
 from typing import Any
 from aaie.graph.models import Node, Edge, NodeType, EdgeType
 from aaie.parsers.base_parser import BaseParser
 
+_REQUIREMENT_RE = re.compile(r'^([a-zA-Z0-9_-]+)([=<>!~]+.*)?$')
+_DEPS_BLOCK_RE = re.compile(r'(?:dependencies|dev-dependencies)\s*=\s*\[(.*?)\]', re.DOTALL)
+_QUOTED_RE = re.compile(r'"([^"]+)"')
+
 
 class PackageParser(BaseParser):
     """Parser for package.json and requirements.txt files."""
@@ -35,14 +40,13 @@ class PackageParser(BaseParser):
         return [], []
 
     def _parse_package_json(self, file_path: Path) -> tuple[list[Node], list[Edge]]:
-        nodes: list[Node] = []
-        edges: list[Edge] = []
-
         try:
-            content = file_path.read_text(encoding="utf-8")
-            data = json.loads(content)
+            data = orjson.loads(file_path.read_bytes())
         except Exception:
-            return nodes, edges
+            return [], []
+
+        nodes_by_id: dict[str, Node] = {}
+        edges_by_key: dict[tuple[str, str], Edge] = {}
 
         project_name = data.get("name", file_path.parent.name)
         project_version = data.get("version", "unknown")
@@ -56,15 +60,16 @@ class PackageParser(BaseParser):
                 "language": "javascript/typescript"
             }
         )
-        nodes.append(project_node)
+        nodes_by_id[project_node.id] = project_node
 
         deps = {}
         deps.update(data.get("dependencies", {}))
         deps.update(data.get("devDependencies", {}))
 
         for lib_name, lib_version in deps.items():
-            lib_node = Node(
-                id=f"lib:{lib_name}",
+            lib_id = f"lib:{lib_name}"
+            nodes_by_id.setdefault(lib_id, Node(
+                id=lib_id,
                 name=lib_name,
                 type=NodeType.LIBRARY,
                 metadata={
@@ -72,25 +77,24 @@ class PackageParser(BaseParser):
                     "package_manager": "npm",
                     "source": str(file_path)
                 }
-            )
-            nodes.append(lib_node)
-            edges.append(Edge(
+            ))
+            edges_by_key.setdefault((project_node.id, lib_id), Edge(
                 source=project_node.id,
-                target=lib_node.id,
+                target=lib_id,
                 type=EdgeType.DEPENDS_ON,
                 metadata={"version": lib_version}
             ))
 
-        return nodes, edges
+        return list(nodes_by_id.values()), list(edges_by_key.values())
 
     def _parse_requirements_txt(self, file_path: Path) -> tuple[list[Node], list[Edge]]:
-        nodes: list[Node] = []
-        edges: list[Edge] = []
-
         try:
             content = file_path.read_text(encoding="utf-8")
         except Exception:
-            return nodes, edges
+            return [], []
+
+        nodes_by_id: dict[str, Node] = {}
+        edges_by_key: dict[tuple[str, str], Edge] = {}
 
         project_node = Node(
             id=f"python:{file_path.parent.name}",
@@ -98,20 +102,21 @@ class PackageParser(BaseParser):
             type=NodeType.SERVICE,
             metadata={"language": "python"}
         )
-        nodes.append(project_node)
+        nodes_by_id[project_node.id] = project_node
 
         for line in content.splitlines():
             line = line.strip()
             if not line or line.startswith("#") or line.startswith("-"):
                 continue
 
-            match = re.match(r'^([a-zA-Z0-9_-]+)([=<>!~]+.*)?$', line)
+            match = _REQUIREMENT_RE.match(line)
             if match:
                 lib_name = match.group(1)
                 lib_version = match.group(2) or "any"
+                lib_id = f"lib:{lib_name}"
 
-                lib_node = Node(
-                    id=f"lib:{lib_name}",
+                nodes_by_id.setdefault(lib_id, Node(
+                    id=lib_id,
                     name=lib_name,
                     type=NodeType.LIBRARY,
                     metadata={
@@ -119,25 +124,24 @@ class PackageParser(BaseParser):
                         "package_manager": "pip",
                         "source": str(file_path)
                     }
-                )
-                nodes.append(lib_node)
-                edges.append(Edge(
+                ))
+                edges_by_key.setdefault((project_node.id, lib_id), Edge(
                     source=project_node.id,
-                    target=lib_node.id,
+                    target=lib_id,
                     type=EdgeType.DEPENDS_ON,
                     metadata={"version": lib_version}
                 ))
 
-        return nodes, edges
+        return list(nodes_by_id.values()), list(edges_by_key.values())
 
     def _parse_pyproject_toml(self, file_path: Path) -> tuple[list[Node], list[Edge]]:
-        nodes: list[Node] = []
-        edges: list[Edge] = []
-
         try:
             content = file_path.read_text(encoding="utf-8")
         except Exception:
-            return nodes, edges
+            return [], []
+
+        nodes_by_id: dict[str, Node] = {}
+        edges_by_key: dict[tuple[str, str], Edge] = {}
 
         project_node = Node(
             id=f"python:{file_path.parent.name}",
@@ -145,28 +149,26 @@ class PackageParser(BaseParser):
             type=NodeType.SERVICE,
             metadata={"language": "python", "build_system": "poetry"}
         )
-        nodes.append(project_node)
+        nodes_by_id[project_node.id] = project_node
 
-        deps_pattern = re.compile(r'(?:dependencies|dev-dependencies)\s*=\s*\[(.*?)\]', re.DOTALL)
-        for match in deps_pattern.finditer(content):
+        for match in _DEPS_BLOCK_RE.finditer(content):
             deps_block = match.group(1)
-            lib_matches = re.findall(r'"([^"]+)"', deps_block)
-            for lib_name in lib_matches:
-                lib_node = Node(
-                    id=f"lib:{lib_name}",
+            for lib_name in _QUOTED_RE.findall(deps_block):
+                lib_id = f"lib:{lib_name}"
+                nodes_by_id.setdefault(lib_id, Node(
+                    id=lib_id,
                     name=lib_name,
                     type=NodeType.LIBRARY,
                     metadata={
                         "package_manager": "poetry",
                         "source": str(file_path)
                     }
-                )
-                nodes.append(lib_node)
-                edges.append(Edge(
+                ))
+                edges_by_key.setdefault((project_node.id, lib_id), Edge(
                     source=project_node.id,
-                    target=lib_node.id,
+                    target=lib_id,
                     type=EdgeType.DEPENDS_ON,
                     metadata={}
                 ))
 
-        return nodes, edges
+        return list(nodes_by_id.values()), list(edges_by_key.values())
@@ -3,19 +3,16 @@ import re
 from pathlib import Path
 from typing import Any
 from aaie.graph.models import Node, Edge, NodeType, EdgeType
+from aaie.parsers._cache import load_python_ast
 from aaie.parsers.base_parser import BaseParser
 
 
 class PythonParser(BaseParser):
-    """Parser for Python source files using the ast module."""
+    """Parser for Python source files using the ast module.
 
-    def __init__(self) -> None:
-        super().__init__()
-        self._current_module: str = ""
-        self._imports: dict[str, list[str]] = {}
-        self._services: list[Node] = []
-        self._databases: list[Node] = []
-        self._function_calls: list[tuple[str, str]] = []
+    Carries no per-file state on the instance, so a single parser can be
+    shared across calls, threads or pool workers.
+    """
 
     @property
     def supported_extensions(self) -> list[str]:
@@ -25,49 +22,59 @@ class PythonParser(BaseParser):
         return file_path.suffix == ".py"
 
     def parse(self, file_path: Path) -> tuple[list[Node], list[Edge]]:
-        self._imports = {}
-        self._services = []
-        self._databases = []
-        self._function_calls = []
+        imports: dict[str, set[str]] = {}
+        services: list[Node] = []
+        databases: list[Node] = []
+        function_calls: list[tuple[str, str]] = []
 
-        self._current_module = self._module_name_from_path(file_path)
+        current_module = self._module_name_from_path(file_path)
 
         try:
-            content = file_path.read_text(encoding="utf-8")
-            tree = ast.parse(content, filename=str(file_path))
-            self._visit_tree(tree)
+            tree = load_python_ast(str(file_path), file_path.stat().st_mtime_ns)
+            visitor = PythonASTVisitor(
+                current_module=current_module,
+                imports=imports,
+                services=services,
+                databases=databases,
+                function_calls=function_calls
+            )
+            visitor.walk(tree)
         except SyntaxError:
             pass
 
         nodes = []
         edges = []
 
-        nodes.extend(self._services)
-        nodes.extend(self._databases)
+        nodes.extend(services)
+        nodes.extend(databases)
 
-        for lib, deps in self._imports.items():
-            if not lib:
-                continue
-            lib_node = Node(
-                id=f"lib:{lib}",
+        # One metadata dict per library, shared by every service edge that
+        # references it; edges are never mutated downstream, so sharing is
+        # safe and halves the allocations of the service x library product.
+        libs = [(lib, f"lib:{lib}", {"import": lib}) for lib in imports if lib]
+
+        for lib, lib_id, _ in libs:
+            nodes.append(Node(
+                id=lib_id,
                 name=lib,
                 type=NodeType.LIBRARY,
-                metadata={"source": self._current_module}
+                metadata={"source": current_module}
+            ))
+
+        edges.extend(
+            Edge(
+                source=service.id,
+                target=lib_id,
+                type=EdgeType.DEPENDS_ON,
+                metadata=lib_meta
             )
-            nodes.append(lib_node)
-
-        for service in self._services:
-            for lib, _ in self._imports.items():
-                if lib:
-                    edges.append(Edge(
-                        source=service.id,
-                        target=f"lib:{lib}",
-                        type=EdgeType.DEPENDS_ON,
-                        metadata={"import": lib}
-                    ))
-
-        for source_func, target_func in self._function_calls:
-            if self._node_exists(source_func, self._services) and self._node_exists(target_func, self._services):
+            for service in services
+            for _, lib_id, lib_meta in libs
+        )
+
+        service_keys = {s.id for s in services} | {s.name for s in services}
+        for source_func, target_func in function_calls:
+            if source_func in service_keys and target_func in service_keys:
                 edges.append(Edge(
                     source=source_func,
                     target=target_func,
@@ -89,25 +96,24 @@ class PythonParser(BaseParser):
         all_parts = list(parts[:-1]) + [stem]
         return ".".join(all_parts)
 
-    def _node_exists(self, name: str, nodes: list[Node]) -> bool:
-        return any(n.id == name or n.name == name for n in nodes)
 
-    def _visit_tree(self, tree: ast.AST) -> None:
-        visitor = PythonASTVisitor(
-            current_module=self._current_module,
-            imports=self._imports,
-            services=self._services,
-            databases=self._databases,
-            function_calls=self._function_calls
-        )
-        visitor.visit(tree)
+# Sentinel pushed onto the walk stack when entering a function body; popping
+# it restores the enclosing-function context once the body is exhausted.
+_POP_FUNC = object()
+
+
+class PythonASTVisitor:
+    """Iterative AST walker collecting imports, services and calls.
 
+    Walks the tree with an explicit stack over ast.iter_child_nodes and a
+    type check per node, rather than NodeVisitor recursion, which pays a
+    Python frame and a method lookup for every node in the module.
+    """
 
-class PythonASTVisitor(ast.NodeVisitor):
     def __init__(
         self,
         current_module: str,
-        imports: dict[str, list[str]],
+        imports: dict[str, set[str]],
         services: list[Node],
         databases: list[Node],
         function_calls: list[tuple[str, str]]
@@ -117,23 +123,45 @@ class PythonASTVisitor(ast.NodeVisitor):
         self.services = services
         self.databases = databases
         self.function_calls = function_calls
+        self._func_stack: list[str] = []
+
+    def walk(self, tree: ast.AST) -> None:
+        stack: list[Any] = [tree]
+        while stack:
+            node = stack.pop()
+            if node is _POP_FUNC:
+                self._func_stack.pop()
+                continue
 
-    def visit_Import(self, node: ast.Import) -> None:
+            node_type = type(node)
+            if node_type is ast.Import:
+                self._on_import(node)
+            elif node_type is ast.ImportFrom:
+                self._on_import_from(node)
+            elif node_type is ast.ClassDef:
+                self._on_class(node)
+            elif node_type is ast.FunctionDef:
+                self._on_function(node)
+                stack.append(_POP_FUNC)
+                self._func_stack.append(f"{self.current_module}.{node.name}")
+            elif node_type is ast.Call:
+                self._on_call(node)
+
+            stack.extend(reversed(list(ast.iter_child_nodes(node))))
+
+    def _on_import(self, node: ast.Import) -> None:
         for alias in node.names:
             lib_name = alias.name.split(".")[0]
-            if lib_name not in self.imports:
-                self.imports[lib_name] = []
-            self.imports[lib_name].append(alias.name)
+            self.imports.setdefault(lib_name, set()).add(alias.name)
 
-    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+    def _on_import_from(self, node: ast.ImportFrom) -> None:
         if node.module:
             lib_name = node.module.split(".")[0]
-            if lib_name not in self.imports:
-                self.imports[lib_name] = []
+            names = self.imports.setdefault(lib_name, set())
             for alias in node.names:
-                self.imports[lib_name].append(f"{node.module}.{alias.name}")
+                names.add(f"{node.module}.{alias.name}")
 
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+    def _on_class(self, node: ast.ClassDef) -> None:
         node_id = f"{self.current_module}.{node.name}"
 
         if self._is_fastapi_app(node) or self._is_flask_app(node):
@@ -152,9 +180,7 @@ class PythonASTVisitor(ast.NodeVisitor):
                 metadata={"module": self.current_module}
             ))
 
-        self.generic_visit(node)
-
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+    def _on_function(self, node: ast.FunctionDef) -> None:
         func_id = f"{self.current_module}.{node.name}"
 
         if self._is_route_handler(node):
@@ -166,13 +192,10 @@ class PythonASTVisitor(ast.NodeVisitor):
                     metadata={"module": self.current_module, "handler": True}
                 ))
 
-        for call in ast.walk(node):
-            if isinstance(call, ast.Call):
-                if isinstance(call.func, ast.Name):
-                    target_id = f"{self.current_module}.{call.func.id}"
-                    self.function_calls.append((func_id, target_id))
-
-        self.generic_visit(node)
+    def _on_call(self, node: ast.Call) -> None:
+        if self._func_stack and isinstance(node.func, ast.Name):
+            target_id = f"{self.current_module}.{node.func.id}"
+            self.function_calls.append((self._func_stack[-1], target_id))
 
     def _is_fastapi_app(self, node: ast.ClassDef) -> bool:
         for base in node.bases:
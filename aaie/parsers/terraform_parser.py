@@ -4,6 +4,43 @@ from typing import Any
 from aaie.graph.models import Node, Edge, NodeType, EdgeType
 from aaie.parsers.base_parser import BaseParser
 
+_RESOURCE_OPEN_RE = re.compile(r'resource\s+"([^"]+)"\s+"([^"]+)"\s*\{')
+_REF_DEP_RE = re.compile(r'\$\{[^}]*?((?:aws_|google_|azurerm_|null_)?[a-z_]+)\.([a-z_]+)')
+_MODULE_RE = re.compile(r'module\.([a-z0-9_-]+)')
+def _iter_resource_blocks(content: str):
+    """Yield (type, name, block) for each resource, tracking brace depth.
+
+    A linear scan that honors nested braces and quoted strings, unlike the
+    previous non-greedy DOTALL regex, which backtracked on large files and
+    cut blocks at the first closing brace in column zero.
+    """
+    pos = 0
+    length = len(content)
+    while True:
+        header = _RESOURCE_OPEN_RE.search(content, pos)
+        if header is None:
+            return
+        depth = 1
+        i = header.end()
+        while i < length and depth:
+            ch = content[i]
+            if ch == '"':
+                i += 1
+                while i < length and content[i] != '"':
+                    i += 2 if content[i] == "\\" else 1
+            elif ch == "{":
+                depth += 1
+            elif ch == "}":
+                depth -= 1
+            i += 1
+        block_end = i - 1 if depth == 0 else i
+        yield header.group(1), header.group(2), content[header.end():block_end]
+        pos = i
+
+
+_META_RE = re.compile(r'\b(?P<key>ami|instance_type|engine|bucket|vpc_id)\s*=\s*"(?P<val>[^"]+)"')
+_SUBNET_RE = re.compile(r'subnet_ids\s*=\s*\[(.*?)\]')
+
 
 class TerraformParser(BaseParser):
     """Parser for Terraform configuration files."""
@@ -37,16 +74,7 @@ class TerraformParser(BaseParser):
         return self._resources, self._dependencies
 
     def _parse_terraform(self, content: str) -> None:
-        resource_pattern = re.compile(
-            r'resource\s+"([^"]+)"\s+"([^"]+)"\s*\{(.*?)\n\}',
-            re.DOTALL | re.MULTILINE
-        )
-
-        for match in resource_pattern.finditer(content):
-            resource_type = match.group(1)
-            resource_name = match.group(2)
-            resource_block = match.group(3)
-
+        for resource_type, resource_name, resource_block in _iter_resource_blocks(content):
             node = self._create_resource_node(resource_type, resource_name, resource_block)
             if node:
                 self._resources.append(node)
@@ -107,33 +135,11 @@ class TerraformParser(BaseParser):
             "resource_name": resource_name
         }
 
-        if "ami" in block:
-            ami_match = re.search(r'ami\s*=\s*"([^"]+)"', block)
-            if ami_match:
-                metadata["ami"] = ami_match.group(1)
-
-        if "instance_type" in block:
-            it_match = re.search(r'instance_type\s*=\s*"([^"]+)"', block)
-            if it_match:
-                metadata["instance_type"] = it_match.group(1)
-
-        if "engine" in block:
-            eng_match = re.search(r'engine\s*=\s*"([^"]+)"', block)
-            if eng_match:
-                metadata["engine"] = eng_match.group(1)
-
-        if "bucket" in block:
-            bkt_match = re.search(r'bucket\s*=\s*"([^"]+)"', block)
-            if bkt_match:
-                metadata["bucket"] = bkt_match.group(1)
-
-        if "vpc_id" in block:
-            vpc_match = re.search(r'vpc_id\s*=\s*"([^"]+)"', block)
-            if vpc_match:
-                metadata["vpc_id"] = vpc_match.group(1)
+        for meta_match in _META_RE.finditer(block):
+            metadata.setdefault(meta_match["key"], meta_match["val"])
 
         if "subnet_ids" in block:
-            subnet_match = re.search(r'subnet_ids\s*=\s*\[(.*?)\]', block)
+            subnet_match = _SUBNET_RE.search(block)
             if subnet_match:
                 metadata["subnet_ids"] = subnet_match.group(1)
 
@@ -147,19 +153,10 @@ class TerraformParser(BaseParser):
     def _extract_dependencies(self, block: str) -> list[str]:
         deps = []
 
-        ref_pattern = re.compile(r'\$\{([^}]+)\}')
-        for match in ref_pattern.finditer(block):
-            ref = match.group(1)
-
-            resource_ref = re.search(r'(aws_|google_|azurerm_|null_)?([a-z_]+)\.([a-z_]+)', ref)
-            if resource_ref:
-                resource_type = resource_ref.group(2)
-                resource_name = resource_ref.group(3)
-                if resource_type and resource_name:
-                    deps.append(f"{resource_type}.{resource_name}")
+        for match in _REF_DEP_RE.finditer(block):
+            deps.append(f"{match.group(1)}.{match.group(2)}")
 
-        module_pattern = re.compile(r'module\.([a-z0-9_-]+)')
-        for match in module_pattern.finditer(block):
+        for match in _MODULE_RE.finditer(block):
             deps.append(f"module.{match.group(1)}")
 
         return deps
@@ -1,7 +1,15 @@
+import io
 from pathlib import Path
 from aaie.graph.models import ScanResult
 from aaie.graph.graph_builder import GraphBuilder
 
+_DOT_HEADER = 'digraph architecture {\n    rankdir="LR";\n    size="12,8";\n    dpi="150";\n\n'
+_DOT_NODE = '    "{id}" [label="{name}", color="{color}", style=filled, fillcolor="{color}", fontcolor=white];\n'
+_DOT_EDGE = '    "{source}" -> "{target}" [label="{type}"];\n'
+
+# Single-pass escaping for values placed inside quoted DOT strings.
+_DOT_ESCAPE = str.maketrans({'"': r'\"', "\\": r"\\", "\n": r"\n"})
+
 
 class DiagramGenerator:
     """Generates architecture diagrams using Graphviz."""
@@ -20,13 +28,12 @@ class DiagramGenerator:
         pass
 
     def generate_png(self, result: ScanResult, output_path: Path) -> None:
-        builder = GraphBuilder()
-        builder.add_nodes_from(result.nodes)
-        builder.add_edges_from(result.edges)
-        
         try:
             import graphviz
         except ImportError:
+            builder = GraphBuilder()
+            builder.add_nodes_from(result.nodes)
+            builder.add_edges_from(result.edges)
             self._generate_dot_file(builder, output_path.with_suffix(".dot"))
             return
 
@@ -61,36 +68,31 @@ class DiagramGenerator:
         self._generate_dot_file(builder, output_path)
 
     def _generate_dot_file(self, builder: GraphBuilder, output_path: Path) -> None:
-        lines = []
-        lines.append("digraph architecture {")
-        lines.append('    rankdir="LR";')
-        lines.append('    size="12,8";')
-        lines.append('    dpi="150";')
-        lines.append("")
-        
-        for node_id in builder._graph.nodes():
-            node_data = builder._graph.nodes[node_id]
+        buf = io.StringIO()
+        buf.write(_DOT_HEADER)
+
+        for node_id, node_data in builder.node_items():
             node_type = node_data.get("type", "service")
-            node_name = node_data.get("name", node_id)
-            color = self.COLOR_MAP.get(node_type, "#95a5a6")
-            
-            lines.append(f'    "{node_id}" [label="{node_name}", color="{color}", style=filled, fillcolor="{color}", fontcolor=white];')
-        
-        lines.append("")
-        
-        for source, target, data in builder._graph.edges(data=True):
-            edge_type = data.get("type", "depends_on")
-            lines.append(f'    "{source}" -> "{target}" [label="{edge_type}"];')
-        
-        lines.append("}")
-        
-        output_path.write_text("\n".join(lines), encoding="utf-8")
+            buf.write(_DOT_NODE.format(
+                id=node_id.translate(_DOT_ESCAPE),
+                name=node_data.get("name", node_id).translate(_DOT_ESCAPE),
+                color=self.COLOR_MAP.get(node_type, "#95a5a6")
+            ))
+
+        buf.write("\n")
+
+        for source, target, data in builder.edge_items():
+            buf.write(_DOT_EDGE.format(
+                source=source.translate(_DOT_ESCAPE),
+                target=target.translate(_DOT_ESCAPE),
+                type=data.get("type", "depends_on").translate(_DOT_ESCAPE)
+            ))
+
+        buf.write("}")
+
+        output_path.write_text(buf.getvalue(), encoding="utf-8")
 
     def generate_svg(self, result: ScanResult, output_path: Path) -> None:
-        builder = GraphBuilder()
-        builder.add_nodes_from(result.nodes)
-        builder.add_edges_from(result.edges)
-        
         try:
             import graphviz
         except ImportError:
@@ -1,9 +1,9 @@
+import heapq
 from collections import Counter
 from datetime import datetime
 from pathlib import Path
-import networkx as nx
+from typing import Any
 from aaie.graph.models import ScanResult, NodeType
-from aaie.graph.graph_builder import GraphBuilder
 
 
 class MarkdownGenerator:
@@ -13,84 +13,105 @@ class MarkdownGenerator:
         self.template_dir = Path(__file__).parent / "templates"
 
     def generate(self, result: ScanResult, output_path: Path) -> None:
-        content = self._build_content(result)
-        output_path.write_text(content, encoding="utf-8")
+        # Stream straight into a buffered file handle rather than collecting
+        # every line in a list and joining: large reports (thousands of
+        # findings) no longer get materialized twice in memory.
+        with output_path.open("w", encoding="utf-8") as out:
+            self._write_content(out, result)
 
-    def _build_content(self, result: ScanResult) -> str:
-        lines = []
+    def _write_content(self, out: Any, result: ScanResult) -> None:
+        write = out.write
         
-        lines.append(f"# Architecture Analysis Report")
-        lines.append("")
-        lines.append(f"**Generated:** {datetime.utcnow().isoformat()}")
-        lines.append(f"**Repository ID:** {result.repo_id}")
-        lines.append("")
+        write(f"# Architecture Analysis Report\n")
+        write("\n")
+        write(f"**Generated:** {datetime.utcnow().isoformat()}\n")
+        write(f"**Repository ID:** {result.repo_id}\n")
+        write("\n")
 
-        lines.append("## Summary")
-        lines.append("")
-        lines.append(f"- **Total Nodes:** {len(result.nodes)}")
-        lines.append(f"- **Total Edges:** {len(result.edges)}")
-        lines.append(f"- **Findings:** {len(result.findings)}")
-        lines.append("")
+        write("## Summary\n")
+        write("\n")
+        write(f"- **Total Nodes:** {len(result.nodes)}\n")
+        write(f"- **Total Edges:** {len(result.edges)}\n")
+        write(f"- **Findings:** {len(result.findings)}\n")
+        write("\n")
 
-        lines.append("## Node Statistics")
-        lines.append("")
+        write("## Node Statistics\n")
+        write("\n")
         
         type_counts = Counter(n.type for n in result.nodes)
         for node_type, count in sorted(type_counts.items()):
-            lines.append(f"- **{node_type}:** {count}")
-        lines.append("")
+            write(f"- **{node_type}:** {count}\n")
+        write("\n")
 
-        lines.append("## Findings")
-        lines.append("")
+        write("## Findings\n")
+        write("\n")
         
         if result.findings:
             for finding in result.findings:
                 severity_emoji = self._severity_emoji(finding.severity)
-                lines.append(f"### {severity_emoji} {finding.rule_id}")
-                lines.append("")
-                lines.append(f"**Severity:** {finding.severity}")
-                lines.append("")
-                lines.append(f"**Message:** {finding.message}")
-                lines.append("")
+                write(f"### {severity_emoji} {finding.rule_id}\n")
+                write("\n")
+                write(f"**Severity:** {finding.severity}\n")
+                write("\n")
+                write(f"**Message:** {finding.message}\n")
+                write("\n")
                 if finding.node_ids:
-                    lines.append(f"**Affected Nodes:** {', '.join(finding.node_ids)}")
-                    lines.append("")
+                    write(f"**Affected Nodes:** {', '.join(finding.node_ids)}\n")
+                    write("\n")
         else:
-            lines.append("No findings detected.")
-            lines.append("")
-
-        lines.append("## Top Central Nodes")
-        lines.append("")
-        
-        builder = GraphBuilder()
-        builder.add_nodes_from(result.nodes)
-        builder.add_edges_from(result.edges)
-        
-        if builder.number_of_nodes() > 0:
-            centrality = nx.degree_centrality(builder.graph)
-            sorted_centrality = sorted(centrality.items(), key=lambda x: x[1], reverse=True)[:10]
-            
-            for node_id, cent in sorted_centrality:
-                lines.append(f"- **{node_id}** (centrality: {cent:.3f})")
+            write("No findings detected.\n")
+            write("\n")
+
+        write("## Top Central Nodes\n")
+        write("\n")
+
+        centrality = self._degree_centrality(result)
+        if centrality:
+            top_centrality = heapq.nlargest(10, centrality.items(), key=lambda x: x[1])
+
+            for node_id, cent in top_centrality:
+                write(f"- **{node_id}** (centrality: {cent:.3f})\n")
         else:
-            lines.append("No nodes in graph.")
-        lines.append("")
+            write("No nodes in graph.\n")
+        write("\n")
 
-        lines.append("## Dependency Matrix")
-        lines.append("")
-        lines.append("### Edges by Type")
-        lines.append("")
+        write("## Dependency Matrix\n")
+        write("\n")
+        write("### Edges by Type\n")
+        write("\n")
         
         edge_counts = Counter(e.type for e in result.edges)
         for edge_type, count in sorted(edge_counts.items()):
-            lines.append(f"- **{edge_type}:** {count}")
-        lines.append("")
+            write(f"- **{edge_type}:** {count}\n")
+        write("\n")
 
-        lines.append("## Suggested Improvements")
-        lines.append("")
-        lines.extend(self._generate_suggestions(result))
-        
-        return "\n".join(lines)
+        write("## Suggested Improvements\n")
+        write("\n")
+        for suggestion in self._generate_suggestions(result):
+            write(suggestion)
+            write("\n")
+
+    @staticmethod
+    def _degree_centrality(result: ScanResult) -> dict[str, float]:
+        """Degree centrality computed straight from the scan result.
+
+        Building a GraphBuilder plus an nx.DiGraph just to divide degrees
+        by (n - 1) duplicated the whole graph in the report path; counting
+        unique edge endpoints over the result gives the same numbers.
+        """
+        degree = dict.fromkeys((node.id for node in result.nodes), 0)
+        n = len(degree)
+        if n <= 1:
+            return dict.fromkeys(degree, 1.0)
+
+        for source, target in {(edge.source, edge.target) for edge in result.edges}:
+            if source in degree:
+                degree[source] += 1
+            if target in degree:
+                degree[target] += 1
+
+        scale = 1.0 / (n - 1)
+        return {node_id: count * scale for node_id, count in degree.items()}
 
     def _severity_emoji(self, severity: str) -> str:
         mapping = {
@@ -121,94 +142,115 @@ class MarkdownGenerator:
         suggestions.append("")
         return suggestions
 
-    def generate_diff_report(self, old_result: ScanResult, new_result: ScanResult, output_path: Path) -> None:
-        content = self._build_diff_content(old_result, new_result)
-        output_path.write_text(content, encoding="utf-8")
+    def generate_diff_report(
+        self,
+        old_result: ScanResult,
+        new_result: ScanResult,
+        output_path: Path,
+        diff: dict[str, Any] | None = None
+    ) -> None:
+        with output_path.open("w", encoding="utf-8") as out:
+            self._write_diff_content(out, old_result, new_result, diff)
 
-    def _build_diff_content(self, old_result: ScanResult, new_result: ScanResult) -> str:
-        lines = []
-        
-        lines.append(f"# Architecture Diff Report")
-        lines.append("")
-        lines.append(f"**Generated:** {datetime.utcnow().isoformat()}")
-        lines.append("")
+    def _write_diff_content(
+        self,
+        out: Any,
+        old_result: ScanResult,
+        new_result: ScanResult,
+        diff: dict[str, Any] | None = None
+    ) -> None:
+        """Render the diff report.
 
-        old_nodes = {n.id for n in old_result.nodes}
-        new_nodes = {n.id for n in new_result.nodes}
-        
-        added_nodes = new_nodes - old_nodes
-        removed_nodes = old_nodes - new_nodes
-        
-        lines.append("## Node Changes")
-        lines.append("")
-        lines.append(f"- **Added:** {len(added_nodes)}")
-        lines.append(f"- **Removed:** {len(removed_nodes)}")
-        lines.append("")
+        When a precomputed delta is supplied (e.g. from Database.get_diff,
+        which pushes the set differences into SQL), the full in-memory set
+        operations over both results are skipped entirely.
+        """
+        if diff is not None:
+            added_nodes = diff["added_nodes"]
+            removed_nodes = diff["removed_nodes"]
+            added_edges = diff["added_edges"]
+            removed_edges = diff["removed_edges"]
+            added_findings = diff["added_findings"]
+            removed_findings = diff["removed_findings"]
+        else:
+            old_nodes = {n.id for n in old_result.nodes}
+            new_nodes = {n.id for n in new_result.nodes}
+            added_nodes = new_nodes - old_nodes
+            removed_nodes = old_nodes - new_nodes
+
+            old_edges = {(e.source, e.target) for e in old_result.edges}
+            new_edges = {(e.source, e.target) for e in new_result.edges}
+            added_edges = new_edges - old_edges
+            removed_edges = old_edges - new_edges
+
+            old_findings = set((f.rule_id, f.severity, f.message) for f in old_result.findings)
+            new_findings = set((f.rule_id, f.severity, f.message) for f in new_result.findings)
+            added_findings = new_findings - old_findings
+            removed_findings = old_findings - new_findings
+
+        write = out.write
+
+        write(f"# Architecture Diff Report\n")
+        write("\n")
+        write(f"**Generated:** {datetime.utcnow().isoformat()}\n")
+        write("\n")
+
+        write("## Node Changes\n")
+        write("\n")
+        write(f"- **Added:** {len(added_nodes)}\n")
+        write(f"- **Removed:** {len(removed_nodes)}\n")
+        write("\n")
         
         if added_nodes:
-            lines.append("### Added Nodes")
-            lines.append("")
+            write("### Added Nodes\n")
+            write("\n")
             for node_id in sorted(added_nodes):
-                lines.append(f"- {node_id}")
-            lines.append("")
+                write(f"- {node_id}\n")
+            write("\n")
         
         if removed_nodes:
-            lines.append("### Removed Nodes")
-            lines.append("")
+            write("### Removed Nodes\n")
+            write("\n")
             for node_id in sorted(removed_nodes):
-                lines.append(f"- {node_id}")
-            lines.append("")
+                write(f"- {node_id}\n")
+            write("\n")
 
-        old_edges = {(e.source, e.target) for e in old_result.edges}
-        new_edges = {(e.source, e.target) for e in new_result.edges}
-        
-        added_edges = new_edges - old_edges
-        removed_edges = old_edges - new_edges
-        
-        lines.append("## Edge Changes")
-        lines.append("")
-        lines.append(f"- **Added:** {len(added_edges)}")
-        lines.append(f"- **Removed:** {len(removed_edges)}")
-        lines.append("")
+        write("## Edge Changes\n")
+        write("\n")
+        write(f"- **Added:** {len(added_edges)}\n")
+        write(f"- **Removed:** {len(removed_edges)}\n")
+        write("\n")
         
         if added_edges:
-            lines.append("### Added Edges")
-            lines.append("")
+            write("### Added Edges\n")
+            write("\n")
             for source, target in sorted(added_edges):
-                lines.append(f"- {source} -> {target}")
-            lines.append("")
+                write(f"- {source} -> {target}\n")
+            write("\n")
         
         if removed_edges:
-            lines.append("### Removed Edges")
-            lines.append("")
+            write("### Removed Edges\n")
+            write("\n")
             for source, target in sorted(removed_edges):
-                lines.append(f"- {source} -> {target}")
-            lines.append("")
+                write(f"- {source} -> {target}\n")
+            write("\n")
 
-        old_findings = set((f.rule_id, f.severity, f.message) for f in old_result.findings)
-        new_findings = set((f.rule_id, f.severity, f.message) for f in new_result.findings)
-        
-        added_findings = new_findings - old_findings
-        removed_findings = old_findings - new_findings
-        
-        lines.append("## Findings Changes")
-        lines.append("")
-        lines.append(f"- **New:** {len(added_findings)}")
-        lines.append(f"- **Resolved:** {len(removed_findings)}")
-        lines.append("")
+        write("## Findings Changes\n")
+        write("\n")
+        write(f"- **New:** {len(added_findings)}\n")
+        write(f"- **Resolved:** {len(removed_findings)}\n")
+        write("\n")
         
         if added_findings:
-            lines.append("### New Findings")
-            lines.append("")
+            write("### New Findings\n")
+            write("\n")
             for rule_id, severity, message in sorted(added_findings):
-                lines.append(f"- **[{severity}]** {rule_id}: {message}")
-            lines.append("")
+                write(f"- **[{severity}]** {rule_id}: {message}\n")
+            write("\n")
         
         if removed_findings:
-            lines.append("### Resolved Findings")
-            lines.append("")
+            write("### Resolved Findings\n")
+            write("\n")
             for rule_id, severity, message in sorted(removed_findings):
-                lines.append(f"- ~~{rule_id}: {message}~~")
-            lines.append("")
-
-        return "\n".join(lines)
+                write(f"- ~~{rule_id}: {message}~~\n")
+            write("\n")
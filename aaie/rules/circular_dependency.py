@@ -16,14 +16,12 @@ class CircularDependencyRule(BaseRule):
         findings = []
 
         try:
-            cycles = list(nx.simple_cycles(graph))
+            components = self._cyclic_components(graph)
         except Exception:
             return findings
 
-        for cycle in cycles:
-            if len(cycle) < 2:
-                continue
-
+        for component in components:
+            cycle = sorted(component)
             cycle_str = " -> ".join(cycle)
             finding = Finding(
                 rule_id=self.rule_id,
@@ -35,3 +33,30 @@ class CircularDependencyRule(BaseRule):
             findings.append(finding)
 
         return findings
+
+    @staticmethod
+    def _cyclic_components(graph: nx.DiGraph) -> list[set[str]]:
+        """Return the non-trivial strongly connected components of graph.
+
+        The result is cached on the graph attribute dict, keyed by the
+        current node/edge counts, so re-evaluating rules or regenerating
+        reports against the same snapshot skips the recomputation. A DAG
+        check runs first: acyclic graphs, the common case, are settled in
+        one O(V+E) pass without materializing any components.
+        """
+        fingerprint = (graph.number_of_nodes(), graph.number_of_edges())
+        cached = graph.graph.get("_cyclic_components")
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        if nx.is_directed_acyclic_graph(graph):
+            components: list[set[str]] = []
+        else:
+            components = [
+                component
+                for component in nx.strongly_connected_components(graph)
+                if len(component) >= 2
+            ]
+
+        graph.graph["_cyclic_components"] = (fingerprint, components)
+        return components
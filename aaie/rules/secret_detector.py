@@ -1,10 +1,18 @@
+import bisect
+import itertools
+import mmap
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 import networkx as nx
 from aaie.graph.models import Finding
 from aaie.rules.base_rule import BaseRule
 
+# Below this many files the pool spin-up costs more than it saves and files
+# are scanned inline in the evaluating process.
+PARALLEL_SCAN_THRESHOLD = 50
+
 
 class SecretDetectorRule(BaseRule):
     """Detects hardcoded secrets in code and configuration files."""
@@ -22,6 +30,33 @@ class SecretDetectorRule(BaseRule):
         ("stripe_key", re.compile(r'(?:sk|pk)_(?:test|live)_[a-zA-Z0-9]{24,}')),
     ]
 
+    # All patterns fused into one alternation so a file is walked once
+    # instead of once per pattern; the matching branch is recovered from
+    # match.lastgroup. Case-insensitive patterns keep their flag via a
+    # scoped (?i:...) group so the case-sensitive ones stay strict.
+    COMBINED_RE: re.Pattern[str] = re.compile("|".join(
+        "(?P<{}>{})".format(
+            name,
+            f"(?i:{pattern.pattern})" if pattern.flags & re.IGNORECASE else pattern.pattern
+        )
+        for name, pattern in SECRET_PATTERNS
+    ))
+
+    # Bytes twin of COMBINED_RE for scanning memory-mapped files without
+    # decoding them first; group names are shared between the two.
+    COMBINED_BYTES_RE: re.Pattern[bytes] = re.compile(COMBINED_RE.pattern.encode())
+
+    # Every secret pattern requires one of these substrings somewhere in the
+    # file, so a single cheap pass can rule out the common no-secrets case
+    # before the full alternation runs.
+    PREFILTER_RE: re.Pattern[bytes] = re.compile(
+        rb'key|secret|token|password|passwd|pwd|begin|xox|eyJ|sk_|pk_|database_url|db_url',
+        re.IGNORECASE
+    )
+
+    # Str twin of PREFILTER_RE, for metadata values that are already text.
+    PREFILTER_STR_RE: re.Pattern[str] = re.compile(PREFILTER_RE.pattern.decode(), re.IGNORECASE)
+
     def __init__(self) -> None:
         super().__init__(
             rule_id="secret_detector",
@@ -30,72 +65,114 @@ class SecretDetectorRule(BaseRule):
 
     def evaluate(self, graph: nx.DiGraph) -> list[Finding]:
         findings = []
+        file_tasks: list[tuple[str, str]] = []
 
         for node_id, node_data in graph.nodes(data=True):
             metadata = node_data.get("metadata", {})
             
             if "source" in metadata:
-                findings.extend(self._scan_file(metadata["source"], node_id))
+                file_tasks.append((metadata["source"], node_id))
 
             if "dockerfile" in metadata:
-                findings.extend(self._scan_file(metadata["dockerfile"], node_id))
+                file_tasks.append((metadata["dockerfile"], node_id))
 
             for key, value in metadata.items():
                 if isinstance(value, str):
                     findings.extend(self._scan_string(value, node_id, key))
 
+        # File scanning is CPU-bound regex work with no shared state, so on
+        # large scans it fans out across a process pool; each worker returns
+        # plain Finding lists that are concatenated in submission order.
+        if len(file_tasks) >= PARALLEL_SCAN_THRESHOLD:
+            with ProcessPoolExecutor() as executor:
+                for file_findings in executor.map(
+                    _scan_file,
+                    (task[0] for task in file_tasks),
+                    (task[1] for task in file_tasks),
+                    itertools.repeat(self.rule_id),
+                    chunksize=16
+                ):
+                    findings.extend(file_findings)
+        else:
+            for file_path, node_id in file_tasks:
+                findings.extend(self._scan_file(file_path, node_id))
+
         return findings
 
     def _scan_file(self, file_path: str, node_id: str) -> list[Finding]:
-        findings = []
-        
-        try:
-            path = Path(file_path)
-            if not path.exists():
+        return _scan_file(file_path, node_id, self.rule_id)
+
+    def _scan_string(self, text: str, node_id: str, context: str) -> list[Finding]:
+        findings: list[Finding] = []
+
+        # Metadata values are scanned once per node and key, so this path
+        # reuses the prefilter and fused alternation rather than running
+        # every pattern against every value. One finding per secret type,
+        # matching the old per-pattern behavior.
+        if self.PREFILTER_STR_RE.search(text) is None:
+            return findings
+
+        seen: set[str | None] = set()
+        for match in self.COMBINED_RE.finditer(text):
+            secret_type = match.lastgroup
+            if secret_type in seen:
+                continue
+            seen.add(secret_type)
+            findings.append(Finding(
+                rule_id=self.rule_id,
+                severity="error",
+                message=f"Potential {secret_type} detected in node metadata ({context})",
+                node_ids=[node_id],
+                metadata={"type": secret_type, "context": context}
+            ))
+
+        return findings
+
+
+def _scan_file(file_path: str, node_id: str, rule_id: str) -> list[Finding]:
+    """Scan one file for secrets; module-level so pool workers can pickle it."""
+    findings: list[Finding] = []
+
+    try:
+        path = Path(file_path)
+        if not path.exists():
+            return findings
+
+        # Scan the file through a read-only memory map: the kernel pages
+        # bytes in on demand, and the bytes pattern skips the UTF-8
+        # decode and full in-memory copy that read_text paid for.
+        with open(path, "rb") as handle:
+            try:
+                mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # zero-length file
                 return findings
-            
-            content = path.read_text(encoding="utf-8")
-            
-            for secret_type, pattern in self.SECRET_PATTERNS:
-                matches = pattern.finditer(content)
-                for match in matches:
+            try:
+                if SecretDetectorRule.PREFILTER_RE.search(mapped) is None:
+                    return findings
+
+                # Newline offsets collected once per file; each match
+                # then finds its line in O(log n) instead of rescanning
+                # the file prefix.
+                newline_offsets = [m.start() for m in re.finditer(b'\n', mapped)]
+
+                for match in SecretDetectorRule.COMBINED_BYTES_RE.finditer(mapped):
+                    secret_type = match.lastgroup
+                    line_num = bisect.bisect_left(newline_offsets, match.start()) + 1
                     if secret_type == "private_key":
-                        line_num = content[:match.start()].count('\n') + 1
-                        finding = Finding(
-                            rule_id=self.rule_id,
-                            severity="error",
-                            message=f"Private key detected in {file_path} (line {line_num})",
-                            node_ids=[node_id],
-                            metadata={"file": file_path, "line": line_num, "type": secret_type}
-                        )
+                        message = f"Private key detected in {file_path} (line {line_num})"
                     else:
-                        line_num = content[:match.start()].count('\n') + 1
-                        finding = Finding(
-                            rule_id=self.rule_id,
-                            severity="error",
-                            message=f"Potential {secret_type} detected in {file_path} (line {line_num})",
-                            node_ids=[node_id],
-                            metadata={"file": file_path, "line": line_num, "type": secret_type}
-                        )
-                    findings.append(finding)
-                    
-        except Exception:
-            pass
-            
-        return findings
+                        message = f"Potential {secret_type} detected in {file_path} (line {line_num})"
+                    findings.append(Finding(
+                        rule_id=rule_id,
+                        severity="error",
+                        message=message,
+                        node_ids=[node_id],
+                        metadata={"file": file_path, "line": line_num, "type": secret_type}
+                    ))
+            finally:
+                mapped.close()
 
-    def _scan_string(self, text: str, node_id: str, context: str) -> list[Finding]:
-        findings = []
-        
-        for secret_type, pattern in self.SECRET_PATTERNS:
-            if pattern.search(text):
-                finding = Finding(
-                    rule_id=self.rule_id,
-                    severity="error",
-                    message=f"Potential {secret_type} detected in node metadata ({context})",
-                    node_ids=[node_id],
-                    metadata={"type": secret_type, "context": context}
-                )
-                findings.append(finding)
-                
-        return findings
+    except Exception:
+        pass
+
+    return findings
@@ -2,6 +2,10 @@ import networkx as nx
 from aaie.graph.models import Finding
 from aaie.rules.base_rule import BaseRule
 
+# Node types whose isolation is worth flagging; checked once per node, so a
+# frozenset keeps the membership test O(1).
+_RELIABILITY_TYPES = frozenset({"service", "database", "queue", "container"})
+
 
 class SinglePointFailureRule(BaseRule):
     """Detects single points of failure in the architecture."""
@@ -16,13 +20,19 @@ class SinglePointFailureRule(BaseRule):
     def evaluate(self, graph: nx.DiGraph) -> list[Finding]:
         findings = []
 
-        for node_id in graph.nodes():
-            in_degree = graph.in_degree(node_id)
-            node_data = graph.nodes[node_id]
-            node_name = node_data.get("name", node_id)
+        # One pass over the node dict, reading degrees as dict lengths from
+        # the adjacency mappings; predecessors are only materialized on the
+        # rare path where a finding is actually emitted.
+        pred = graph.pred
+        succ = graph.succ
+        threshold = self.threshold
+
+        for node_id, node_data in graph.nodes(data=True):
+            in_degree = len(pred[node_id])
             node_type = node_data.get("type", "unknown")
-            
-            if in_degree >= self.threshold:
+
+            if in_degree >= threshold:
+                node_name = node_data.get("name", node_id)
                 finding = Finding(
                     rule_id=self.rule_id,
                     severity="warning",
@@ -31,26 +41,24 @@ class SinglePointFailureRule(BaseRule):
                     metadata={
                         "in_degree": in_degree,
                         "node_type": node_type,
-                        "predecessors": list(graph.predecessors(node_id))
+                        "predecessors": list(pred[node_id])
                     }
                 )
                 findings.append(finding)
 
-            if node_type_has_reliability_concern(node_type):
-                successors = list(graph.successors(node_id))
-                if len(successors) == 0:
-                    finding = Finding(
-                        rule_id=self.rule_id,
-                        severity="info",
-                        message=f"Node {node_id} has no outgoing connections - may be orphaned",
-                        node_ids=[node_id],
-                        metadata={"type": "orphaned"}
-                    )
-                    findings.append(finding)
+            if not succ[node_id] and node_type_has_reliability_concern(node_type):
+                finding = Finding(
+                    rule_id=self.rule_id,
+                    severity="info",
+                    message=f"Node {node_id} has no outgoing connections - may be orphaned",
+                    node_ids=[node_id],
+                    metadata={"type": "orphaned"}
+                )
+                findings.append(finding)
 
         return findings
 
 
 def node_type_has_reliability_concern(node_type: str) -> bool:
     """Check if a node type is a reliability concern when isolated."""
-    return node_type in ("service", "database", "queue", "container")
+    return node_type in _RELIABILITY_TYPES
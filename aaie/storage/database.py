@@ -1,11 +1,16 @@
-import json
 import sqlite3
 from datetime import datetime
 from pathlib import Path
 from typing import Any
+import orjson
 from aaie.graph.models import Node, Edge, Finding, ScanResult
 
 
+def _dumps(obj: Any) -> str:
+    """Serialize to a JSON string for TEXT columns via orjson."""
+    return orjson.dumps(obj).decode()
+
+
 class Database:
     """SQLite database for storing scan results."""
 
@@ -15,10 +20,22 @@ class Database:
         
         db_path.parent.mkdir(parents=True, exist_ok=True)
         self.db_path = db_path
+        # One long-lived connection instead of a connect per method call:
+        # connection setup and schema-lock acquisition are not free, and a
+        # shared connection lets the pragmas below apply to every query.
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-65536")
         self._init_db()
 
+    def close(self) -> None:
+        self._conn.close()
+
     def _init_db(self) -> None:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS repositories (
                     id TEXT PRIMARY KEY,
@@ -76,37 +93,41 @@ class Database:
                 )
             """)
 
+            # get_scan filters all three result tables by scan_id, and
+            # get_latest_scan/list_scans order scans per repository; without
+            # these indexes each of those reads is a full table scan.
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_nodes_scan ON nodes(scan_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_edges_scan ON edges(scan_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_findings_scan ON findings(scan_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_scans_repo_time ON scans(repo_id, scanned_at DESC)")
+
     def save_repository(self, repo_id: str, name: str, path: str) -> None:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn as conn:
             conn.execute("""
                 INSERT OR REPLACE INTO repositories (id, name, path, created_at)
                 VALUES (?, ?, ?, ?)
             """, (repo_id, name, path, datetime.utcnow().isoformat()))
 
     def get_repository(self, repo_id: str) -> dict[str, Any] | None:
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("""
-                SELECT * FROM repositories WHERE id = ?
-            """, (repo_id,))
-            row = cursor.fetchone()
-            if row:
-                return dict(row)
-            return None
+        cursor = self._conn.execute("""
+            SELECT * FROM repositories WHERE id = ?
+        """, (repo_id,))
+        row = cursor.fetchone()
+        if row:
+            return dict(row)
+        return None
 
     def list_repositories(self) -> list[dict[str, Any]]:
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("SELECT * FROM repositories ORDER BY last_scanned DESC")
-            return [dict(row) for row in cursor.fetchall()]
+        cursor = self._conn.execute("SELECT * FROM repositories ORDER BY last_scanned DESC")
+        return [dict(row) for row in cursor.fetchall()]
 
     def save_scan(self, repo_id: str, result: ScanResult) -> int:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn as conn:
             scanned_at = datetime.utcnow().isoformat()
             cursor = conn.execute("""
                 INSERT INTO scans (repo_id, scanned_at, metadata)
                 VALUES (?, ?, ?)
-            """, (repo_id, scanned_at, json.dumps(result.metadata)))
+            """, (repo_id, scanned_at, _dumps(result.metadata)))
             scan_id = cursor.lastrowid
             if scan_id is None:
                 raise RuntimeError("Failed to save scan")
@@ -115,94 +136,136 @@ class Database:
                 UPDATE repositories SET last_scanned = ? WHERE id = ?
             """, (scanned_at, repo_id))
 
-            for node in result.nodes:
-                conn.execute("""
-                    INSERT INTO nodes (id, scan_id, name, type, metadata)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (node.id, scan_id, node.name, node.type, json.dumps(node.metadata)))
-
-            for edge in result.edges:
-                conn.execute("""
-                    INSERT INTO edges (scan_id, source, target, type, metadata)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (scan_id, edge.source, edge.target, edge.type, json.dumps(edge.metadata)))
-
-            for finding in result.findings:
-                conn.execute("""
-                    INSERT INTO findings (scan_id, rule_id, severity, message, node_ids, metadata)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (
-                    scan_id, 
-                    finding.rule_id, 
-                    finding.severity, 
-                    finding.message, 
-                    json.dumps(finding.node_ids),
-                    json.dumps(finding.metadata)
-                ))
+            conn.executemany("""
+                INSERT INTO nodes (id, scan_id, name, type, metadata)
+                VALUES (?, ?, ?, ?, ?)
+            """, (
+                (node.id, scan_id, node.name, node.type, _dumps(node.metadata))
+                for node in result.nodes
+            ))
+
+            conn.executemany("""
+                INSERT INTO edges (scan_id, source, target, type, metadata)
+                VALUES (?, ?, ?, ?, ?)
+            """, (
+                (scan_id, edge.source, edge.target, edge.type, _dumps(edge.metadata))
+                for edge in result.edges
+            ))
+
+            conn.executemany("""
+                INSERT INTO findings (scan_id, rule_id, severity, message, node_ids, metadata)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (
+                (
+                    scan_id,
+                    finding.rule_id,
+                    finding.severity,
+                    finding.message,
+                    _dumps(finding.node_ids),
+                    _dumps(finding.metadata)
+                )
+                for finding in result.findings
+            ))
 
             return scan_id
 
     def get_scan(self, scan_id: int) -> ScanResult | None:
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            
-            scan_row = conn.execute("SELECT * FROM scans WHERE id = ?", (scan_id,)).fetchone()
-            if not scan_row:
-                return None
-
-            repo_id = scan_row["repo_id"]
-
-            nodes = []
-            for node_row in conn.execute("SELECT * FROM nodes WHERE scan_id = ?", (scan_id,)):
-                nodes.append(Node(
-                    id=node_row["id"],
-                    name=node_row["name"],
-                    type=node_row["type"],
-                    metadata=json.loads(node_row["metadata"] or "{}")
-                ))
-
-            edges = []
-            for edge_row in conn.execute("SELECT * FROM edges WHERE scan_id = ?", (scan_id,)):
-                edges.append(Edge(
-                    source=edge_row["source"],
-                    target=edge_row["target"],
-                    type=edge_row["type"],
-                    metadata=json.loads(edge_row["metadata"] or "{}")
-                ))
-
-            findings = []
-            for finding_row in conn.execute("SELECT * FROM findings WHERE scan_id = ?", (scan_id,)):
-                findings.append(Finding(
-                    rule_id=finding_row["rule_id"],
-                    severity=finding_row["severity"],
-                    message=finding_row["message"],
-                    node_ids=json.loads(finding_row["node_ids"] or "[]"),
-                    metadata=json.loads(finding_row["metadata"] or "{}")
-                ))
-
-            return ScanResult(
-                repo_id=repo_id,
-                nodes=nodes,
-                edges=edges,
-                findings=findings,
-                metadata=json.loads(scan_row["metadata"] or "{}")
-            )
+        scan_row = self._conn.execute("SELECT * FROM scans WHERE id = ?", (scan_id,)).fetchone()
+        if not scan_row:
+            return None
+        return self._load_scan(scan_row)
+
+    def _load_scan(self, scan_row: sqlite3.Row) -> ScanResult:
+        """Materialize a ScanResult from an already-fetched scans row."""
+        conn = self._conn
+        scan_id = scan_row["id"]
+        repo_id = scan_row["repo_id"]
+
+        nodes = []
+        for node_row in conn.execute("SELECT * FROM nodes WHERE scan_id = ?", (scan_id,)):
+            nodes.append(Node(
+                id=node_row["id"],
+                name=node_row["name"],
+                type=node_row["type"],
+                metadata=orjson.loads(node_row["metadata"] or "{}")
+            ))
+
+        edges = []
+        for edge_row in conn.execute("SELECT * FROM edges WHERE scan_id = ?", (scan_id,)):
+            edges.append(Edge(
+                source=edge_row["source"],
+                target=edge_row["target"],
+                type=edge_row["type"],
+                metadata=orjson.loads(edge_row["metadata"] or "{}")
+            ))
+
+        findings = []
+        for finding_row in conn.execute("SELECT * FROM findings WHERE scan_id = ?", (scan_id,)):
+            findings.append(Finding(
+                rule_id=finding_row["rule_id"],
+                severity=finding_row["severity"],
+                message=finding_row["message"],
+                node_ids=orjson.loads(finding_row["node_ids"] or "[]"),
+                metadata=orjson.loads(finding_row["metadata"] or "{}")
+            ))
+
+        return ScanResult.model_construct(
+            repo_id=repo_id,
+            nodes=nodes,
+            edges=edges,
+            findings=findings,
+            metadata=orjson.loads(scan_row["metadata"] or "{}")
+        )
 
     def get_latest_scan(self, repo_id: str) -> ScanResult | None:
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                SELECT id FROM scans WHERE repo_id = ? ORDER BY scanned_at DESC LIMIT 1
-            """, (repo_id,))
-            row = cursor.fetchone()
-            if row:
-                return self.get_scan(row[0])
-            return None
+        # Fetch the full scan row in the same indexed query that finds it,
+        # instead of grabbing the id and re-reading the row via get_scan.
+        scan_row = self._conn.execute("""
+            SELECT * FROM scans WHERE repo_id = ? ORDER BY scanned_at DESC LIMIT 1
+        """, (repo_id,)).fetchone()
+        if scan_row:
+            return self._load_scan(scan_row)
+        return None
+
+    def get_diff(self, old_scan_id: int, new_scan_id: int) -> dict[str, Any]:
+        """Compute the node/edge/finding delta between two stored scans.
+
+        The set differences run as EXCEPT queries over the scan_id indexes,
+        so only the changed rows ever cross into Python — no need to load
+        and materialize both full ScanResults just to diff them.
+        """
+        conn = self._conn
+
+        def node_ids(left: int, right: int) -> list[str]:
+            return [row[0] for row in conn.execute("""
+                SELECT id FROM nodes WHERE scan_id = ?
+                EXCEPT SELECT id FROM nodes WHERE scan_id = ?
+            """, (left, right))]
+
+        def edge_pairs(left: int, right: int) -> list[tuple[str, str]]:
+            return [(row[0], row[1]) for row in conn.execute("""
+                SELECT source, target FROM edges WHERE scan_id = ?
+                EXCEPT SELECT source, target FROM edges WHERE scan_id = ?
+            """, (left, right))]
+
+        def finding_rows(left: int, right: int) -> list[tuple[str, str, str]]:
+            return [(row[0], row[1], row[2]) for row in conn.execute("""
+                SELECT rule_id, severity, message FROM findings WHERE scan_id = ?
+                EXCEPT SELECT rule_id, severity, message FROM findings WHERE scan_id = ?
+            """, (left, right))]
+
+        return {
+            "added_nodes": node_ids(new_scan_id, old_scan_id),
+            "removed_nodes": node_ids(old_scan_id, new_scan_id),
+            "added_edges": edge_pairs(new_scan_id, old_scan_id),
+            "removed_edges": edge_pairs(old_scan_id, new_scan_id),
+            "added_findings": finding_rows(new_scan_id, old_scan_id),
+            "removed_findings": finding_rows(old_scan_id, new_scan_id),
+        }
 
     def list_scans(self, repo_id: str) -> list[dict[str, Any]]:
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("""
-                SELECT id, repo_id, scanned_at, metadata FROM scans 
-                WHERE repo_id = ? ORDER BY scanned_at DESC
-            """, (repo_id,))
-            return [dict(row) for row in cursor.fetchall()]
+        cursor = self._conn.execute("""
+            SELECT id, repo_id, scanned_at, metadata FROM scans 
+            WHERE repo_id = ? ORDER BY scanned_at DESC
+        """, (repo_id,))
+        return [dict(row) for row in cursor.fetchall()]
